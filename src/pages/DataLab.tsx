@@ -24,8 +24,20 @@ interface GeneratedOutput {
   data?: any;
   content?: string;
   downloadFormat?: 'csv' | 'xlsx' | 'txt' | 'md';
+  // Builds the CSV download; outputs without it download their text content
+  csvRows?: () => string[];
 }
 
+type AnalysisIntent = 'correlation' | 'regression' | 'comparison' | 'describe';
+
+// Checked in order; the first intent with a keyword in the request wins
+const ANALYSIS_INTENTS: Array<{ intent: AnalysisIntent; keywords: string[] }> = [
+  { intent: 'correlation', keywords: ['correlation', 'relationship'] },
+  { intent: 'regression', keywords: ['regression', 'predict'] },
+  { intent: 'comparison', keywords: ['compare', 'difference'] },
+  { intent: 'describe', keywords: ['describe', 'summary'] }
+];
+
 export default function DataLab() {
   const { darkMode } = useTheme();
   const [currentStep, setCurrentStep] = useState(1);
@@ -118,15 +130,17 @@ export default function DataLab() {
 
   const handleAnalysisRequest = async (request: string) => {
     const lowerRequest = request.toLowerCase();
-    
-    if (lowerRequest.includes('correlation') || lowerRequest.includes('relationship')) {
-      await runCorrelationAnalysis();
-    } else if (lowerRequest.includes('regression') || lowerRequest.includes('predict')) {
-      await runRegressionAnalysis();
-    } else if (lowerRequest.includes('compare') || lowerRequest.includes('difference')) {
-      await runComparisonAnalysis();
-    } else if (lowerRequest.includes('describe') || lowerRequest.includes('summary')) {
-      showDescriptiveStats();
+    const match = ANALYSIS_INTENTS.find(({ keywords }) => keywords.some(k => lowerRequest.includes(k)));
+
+    const handlers: Record<AnalysisIntent, () => void | Promise<void>> = {
+      correlation: runCorrelationAnalysis,
+      regression: runRegressionAnalysis,
+      comparison: runComparisonAnalysis,
+      describe: showDescriptiveStats
+    };
+
+    if (match) {
+      await handlers[match.intent]();
     } else {
       // General AI response
       addMessage('assistant', 
@@ -192,7 +206,8 @@ export default function DataLab() {
           status: 'ready',
           data: stats,
           content: formatDescriptiveStats(stats),
-          downloadFormat: 'csv'
+          downloadFormat: 'csv',
+          csvRows: () => descriptiveStatsCsvRows(stats)
         };
         setOutputs(prev => [...prev, statsOutput]);
       }
@@ -392,7 +407,11 @@ export default function DataLab() {
   const handleDownload = (output: GeneratedOutput) => {
     if (!output.content) return;
 
-    const blob = new Blob([output.content], { type: 'text/plain;charset=utf-8' });
+    // Hand the CSV rows to the Blob as separate parts rather than joining
+    // them into one large string first
+    const blob = output.csvRows
+      ? new Blob(output.csvRows(), { type: 'text/csv;charset=utf-8' })
+      : new Blob([output.content], { type: 'text/plain;charset=utf-8' });
     saveAs(blob, `${output.name}.${output.downloadFormat || 'txt'}`);
   };
 
@@ -726,31 +745,73 @@ Summary:
 `;
 }
 
+// The same stats object is formatted for the outputs panel, the chat summary
+// and Chapter 4, so the text is built once per upload and reused
+const descriptiveTextCache = new WeakMap<DescriptiveStats, string>();
+
 function formatDescriptiveStats(stats: DescriptiveStats): string {
-  let output = 'DESCRIPTIVE STATISTICS\n=====================\n\n';
-  
-  output += 'CONTINUOUS VARIABLES:\n\n';
+  const cached = descriptiveTextCache.get(stats);
+  if (cached !== undefined) return cached;
+
+  // Collect lines and join once
+  const lines: string[] = ['DESCRIPTIVE STATISTICS', '=====================', '', 'CONTINUOUS VARIABLES:', ''];
+
   Object.entries(stats.continuous).forEach(([varName, data]) => {
-    output += `${varName}:\n`;
-    output += `  N = ${data.n}\n`;
-    output += `  Mean = ${data.mean.toFixed(2)}\n`;
-    output += `  SD = ${data.std.toFixed(2)}\n`;
-    output += `  Median = ${data.median.toFixed(2)}\n`;
-    output += `  Min = ${data.min.toFixed(2)}\n`;
-    output += `  Max = ${data.max.toFixed(2)}\n`;
-    output += `  Skewness = ${data.skewness.toFixed(2)}\n\n`;
+    lines.push(
+      `${varName}:`,
+      `  N = ${data.n}`,
+      `  Mean = ${data.mean.toFixed(2)}`,
+      `  SD = ${data.std.toFixed(2)}`,
+      `  Median = ${data.median.toFixed(2)}`,
+      `  Min = ${data.min.toFixed(2)}`,
+      `  Max = ${data.max.toFixed(2)}`,
+      `  Skewness = ${data.skewness.toFixed(2)}`,
+      ''
+    );
   });
-  
-  output += '\nCATEGORICAL VARIABLES:\n\n';
+
+  lines.push('', 'CATEGORICAL VARIABLES:', '');
   Object.entries(stats.categorical).forEach(([varName, data]) => {
-    output += `${varName} (${data.unique_values} categories):\n`;
+    lines.push(`${varName} (${data.unique_values} categories):`);
     data.categories.slice(0, 5).forEach(cat => {
-      output += `  ${cat.category}: ${cat.n} (${cat.percentage.toFixed(1)}%)\n`;
+      lines.push(`  ${cat.category}: ${cat.n} (${cat.percentage.toFixed(1)}%)`);
     });
-    output += '\n';
+    lines.push('');
   });
-  
-  return output;
+
+  const text = lines.join('\n') + '\n';
+  descriptiveTextCache.set(stats, text);
+  return text;
+}
+
+function csvCell(value: string | number): string {
+  const text = String(value);
+  return /[",\r\n]/.test(text) ? `"${text.replace(/"/g, '""')}"` : text;
+}
+
+function descriptiveStatsCsvRows(stats: DescriptiveStats): string[] {
+  const rows = ['variable,type,n,mean,sd,median,min,max,skewness,category,count,percentage\n'];
+
+  Object.entries(stats.continuous).forEach(([varName, data]) => {
+    rows.push([
+      csvCell(varName), 'continuous', data.n,
+      data.mean.toFixed(4), data.std.toFixed(4), data.median.toFixed(4),
+      data.min.toFixed(4), data.max.toFixed(4), data.skewness.toFixed(4),
+      '', '', ''
+    ].join(',') + '\n');
+  });
+
+  Object.entries(stats.categorical).forEach(([varName, data]) => {
+    data.categories.forEach(cat => {
+      rows.push([
+        csvCell(varName), 'categorical', data.n,
+        '', '', '', '', '', '',
+        csvCell(cat.category), cat.n, cat.percentage.toFixed(2)
+      ].join(',') + '\n');
+    });
+  });
+
+  return rows;
 }
 
 function generateChapter4(
@@ -6,6 +6,7 @@ import {
 } from 'lucide-react';
 import { useTheme } from '../contexts/ThemeContext';
 import { saveAs } from 'file-saver';
+import { fetchWithRetry } from '../utils/fetchWithRetry';
 
 const API_KEY = import.meta.env.VITE_DEEPSEEK_API_KEY;
 const API_URL = 'https://api.deepseek.com/v1/chat/completions';
@@ -601,7 +602,7 @@ Generated by Students Companion - Qualitative Analysis Lab
       throw new Error('DeepSeek API key not configured');
     }
 
-    const response = await fetch(API_URL, {
+    const response = await fetchWithRetry(API_URL, {
       method: 'POST',
       headers: {
         'Content-Type': 'application/json',
@@ -6,6 +6,7 @@
 import type { CourseworkGeneratorInputs } from '../types/coursework';
 import { getMinSources } from '../types/coursework';
 import { parseCoursework, type ParsedCoursework } from '../utils/courseworkParser';
+import { fetchWithRetry } from '../utils/fetchWithRetry';
 
 const API_KEY = import.meta.env.VITE_GEMINI_API_KEY;
 
@@ -243,12 +244,13 @@ export async function generateCoursework(
 
   for (const model of COURSEWORK_MODELS) {
     try {
-      console.log(`🔄 Trying model: ${model}...`);
+      if (import.meta.env.DEV) console.log(`🔄 Trying model: ${model}...`);
       onProgress?.(30, `Generating with ${model}...`);
 
       const url = `https://generativelanguage.googleapis.com/v1beta/models/${model}:generateContent?key=${API_KEY}`;
       
-      const response = await fetch(url, {
+      // The loop falls back to the next model, so fail over instead of retrying
+      const response = await fetchWithRetry(url, {
         method: 'POST',
         headers: {
           'Content-Type': 'application/json',
@@ -262,7 +264,7 @@ export async function generateCoursework(
             maxOutputTokens: maxTokens,
           },
         }),
-      });
+      }, { retries: 0 });
 
       if (!response.ok) {
         const errorText = await response.text();
@@ -279,7 +281,7 @@ export async function generateCoursework(
         throw new Error('No content generated');
       }
 
-      console.log(`✅ Successfully generated coursework with ${model}`);
+      if (import.meta.env.DEV) console.log(`✅ Successfully generated coursework with ${model}`);
       onProgress?.(90, 'Finalizing...');
 
       // Verify output quality
@@ -420,12 +422,13 @@ Output the complete revised coursework now:`;
 
   for (const model of COURSEWORK_MODELS) {
     try {
-      console.log(`🔄 Refining with model: ${model}...`);
+      if (import.meta.env.DEV) console.log(`🔄 Refining with model: ${model}...`);
       onProgress?.(40, `Refining with ${model}...`);
 
       const url = `https://generativelanguage.googleapis.com/v1beta/models/${model}:generateContent?key=${API_KEY}`;
       
-      const response = await fetch(url, {
+      // The loop falls back to the next model, so fail over instead of retrying
+      const response = await fetchWithRetry(url, {
         method: 'POST',
         headers: {
           'Content-Type': 'application/json',
@@ -439,7 +442,7 @@ Output the complete revised coursework now:`;
             maxOutputTokens: 32000,
           },
         }),
-      });
+      }, { retries: 0 });
 
       if (!response.ok) {
         const errorText = await response.text();
@@ -456,7 +459,7 @@ Output the complete revised coursework now:`;
         throw new Error('No content generated');
       }
 
-      console.log(`✅ Successfully refined coursework with ${model}`);
+      if (import.meta.env.DEV) console.log(`✅ Successfully refined coursework with ${model}`);
       onProgress?.(100, 'Refinement complete!');
 
       const parsed = parseCoursework(generatedText);
@@ -4,9 +4,8 @@
  * Replaces the Python backend with AI-powered statistical analysis
  */
 
-import Papa from 'papaparse';
-import * as XLSX from 'xlsx';
 import * as stats from 'simple-statistics';
+import { fetchWithRetry } from '../utils/fetchWithRetry';
 
 const API_KEY = import.meta.env.VITE_DEEPSEEK_API_KEY;
 const API_URL = 'https://api.deepseek.com/v1/chat/completions';
@@ -89,10 +88,19 @@ export interface AnalysisResult {
 
 let currentDataset: DatasetInfo | null = null;
 
+// Locally computed results for the current dataset, keyed by analysis type
+// and variable list
+const localResultCache = new Map<string, AnalysisResult>();
+
+// Descriptive statistics for the current dataset, computed on first request
+let descriptiveStatsCache: DescriptiveStats | null = null;
+
 // ============================================================================
 // FILE PARSING
 // ============================================================================
 
+const EXCEL_EXTENSIONS = new Set(['xlsx', 'xls']);
+
 /**
  * Parse uploaded file (CSV, Excel, SPSS)
  */
@@ -103,11 +111,11 @@ export async function parseDataFile(file: File): Promise<{
   error?: string;
 }> {
   try {
-    const fileExtension = file.name.split('.').pop()?.toLowerCase();
+    const fileExtension = file.name.slice(file.name.lastIndexOf('.') + 1).toLowerCase();
 
     if (fileExtension === 'csv') {
       return await parseCSV(file);
-    } else if (fileExtension === 'xlsx' || fileExtension === 'xls') {
+    } else if (EXCEL_EXTENSIONS.has(fileExtension)) {
       return await parseExcel(file);
     } else {
       return { success: false, error: 'Unsupported file format. Please use CSV or Excel.' };
@@ -126,6 +134,9 @@ async function parseCSV(file: File): Promise<{
   columns?: string[];
   error?: string;
 }> {
+  // Parsers are loaded on first upload rather than with the Data Lab page
+  const { default: Papa } = await import('papaparse');
+
   return new Promise((resolve) => {
     Papa.parse(file, {
       header: true,
@@ -151,6 +162,9 @@ async function parseExcel(file: File): Promise<{
   columns?: string[];
   error?: string;
 }> {
+  // xlsx is large; load it only when an Excel file is actually uploaded
+  const XLSX = await import('xlsx');
+
   return new Promise((resolve) => {
     const reader = new FileReader();
 
@@ -192,16 +206,33 @@ function detectColumnTypes(data: Record<string, any>[]): Record<string, 'continu
   const columns = Object.keys(data[0] || {});
 
   for (const col of columns) {
-    const values = data.map(row => row[col]).filter(v => v !== null && v !== undefined && v !== '');
-    const uniqueValues = new Set(values);
+    // One pass collects the distinct values, the non-missing count and
+    // whether everything is numeric. Once a text value has been seen the
+    // column can only be binary or categorical, so scanning stops as soon
+    // as it has more than two distinct values
+    const uniqueValues = new Set<any>();
+    let count = 0;
+    let numeric = true;
+
+    for (const row of data) {
+      const v = row[col];
+      if (isMissing(v)) continue;
+
+      count++;
+      uniqueValues.add(v);
+      if (numeric && typeof v !== 'number' && isNaN(Number(v))) {
+        numeric = false;
+      }
+      if (!numeric && uniqueValues.size > 2) break;
+    }
 
     if (uniqueValues.size === 0) {
       types[col] = 'categorical';
     } else if (uniqueValues.size === 2) {
       types[col] = 'binary';
-    } else if (values.every(v => typeof v === 'number' || !isNaN(Number(v)))) {
+    } else if (numeric) {
       // Check if continuous or categorical
-      if (uniqueValues.size < 10 || uniqueValues.size < values.length * 0.1) {
+      if (uniqueValues.size < 10 || uniqueValues.size < count * 0.1) {
         types[col] = 'categorical';
       } else {
         types[col] = 'continuous';
@@ -214,6 +245,63 @@ function detectColumnTypes(data: Record<string, any>[]): Record<string, 'continu
   return types;
 }
 
+/** Empty cells count as missing; Number(null) and Number('') would be 0 */
+function isMissing(v: any): boolean {
+  return v === null || v === undefined || v === '';
+}
+
+/** Numeric values of a column with missing entries dropped */
+function numericColumn(data: Record<string, any>[], col: string): number[] {
+  return numericColumns(data, [col])[col];
+}
+
+/**
+ * numericColumn for several columns at once, reading each row a single time
+ * instead of walking the whole dataset once per column
+ */
+function numericColumns(data: Record<string, any>[], cols: string[]): Record<string, number[]> {
+  const columns: Record<string, number[]> = {};
+  cols.forEach(col => {
+    columns[col] = [];
+  });
+
+  for (const row of data) {
+    for (const col of cols) {
+      const raw = row[col];
+      if (isMissing(raw)) continue;
+
+      const value = Number(raw);
+      if (!isNaN(value)) columns[col].push(value);
+    }
+  }
+
+  return columns;
+}
+
+/**
+ * Numeric values of two columns keeping only rows where both are present,
+ * so the i-th x and i-th y always come from the same observation
+ */
+function pairedColumns(data: Record<string, any>[], colX: string, colY: string): [number[], number[]] {
+  const x: number[] = [];
+  const y: number[] = [];
+
+  for (const row of data) {
+    const rawX = row[colX];
+    const rawY = row[colY];
+    if (isMissing(rawX) || isMissing(rawY)) continue;
+
+    const valueX = Number(rawX);
+    const valueY = Number(rawY);
+    if (!isNaN(valueX) && !isNaN(valueY)) {
+      x.push(valueX);
+      y.push(valueY);
+    }
+  }
+
+  return [x, y];
+}
+
 // ============================================================================
 // DATA IMPORT
 // ============================================================================
@@ -231,6 +319,8 @@ export async function importDataset(file: File): Promise<{
 
   const columnTypes = detectColumnTypes(parseResult.data);
 
+  localResultCache.clear();
+  descriptiveStatsCache = null;
   currentDataset = {
     id: `dataset_${Date.now()}`,
     filename: file.name,
@@ -251,8 +341,9 @@ export async function importDataset(file: File): Promise<{
 export function runQualityCheck(): QualityReport | null {
   if (!currentDataset) return null;
 
-  const { data } = currentDataset;
-  const columns = Object.keys(data[0] || {});
+  // Column names were settled when the types were detected at import
+  const { data, columnTypes } = currentDataset;
+  const columns = Object.keys(columnTypes);
   const totalCells = data.length * columns.length;
 
   // Check for duplicates
@@ -264,9 +355,22 @@ export function runQualityCheck(): QualityReport | null {
   const missingByColumn: Record<string, number> = {};
   const highMissingColumns: string[] = [];
 
+  // Tally every column's missing cells in one walk over the rows, without
+  // building a filtered copy of the dataset per column
+  columns.forEach(col => {
+    missingByColumn[col] = 0;
+  });
+  for (const row of data) {
+    for (const col of columns) {
+      const value = row[col];
+      if (isMissing(value)) {
+        missingByColumn[col]++;
+      }
+    }
+  }
+
   columns.forEach(col => {
-    const missing = data.filter(row => row[col] === null || row[col] === undefined || row[col] === '').length;
-    missingByColumn[col] = missing;
+    const missing = missingByColumn[col];
     totalMissing += missing;
 
     if (missing / data.length > 0.2) {
@@ -279,11 +383,14 @@ export function runQualityCheck(): QualityReport | null {
   let columnsWithOutliers = 0;
 
   columns.forEach(col => {
-    if (currentDataset!.columnTypes[col] === 'continuous') {
-      const values = data.map(row => Number(row[col])).filter(v => !isNaN(v));
+    if (columnTypes[col] === 'continuous') {
+      const values = numericColumn(data, col);
       if (values.length > 0) {
-        const q1 = stats.quantile(values, 0.25);
-        const q3 = stats.quantile(values, 0.75);
+        // Sort once and read both quartiles from it; stats.quantile would
+        // copy and partially sort the column again for each call
+        const sorted = values.slice().sort((a, b) => a - b);
+        const q1 = stats.quantileSorted(sorted, 0.25);
+        const q3 = stats.quantileSorted(sorted, 0.75);
         const iqr = q3 - q1;
         const lowerBound = q1 - 1.5 * iqr;
         const upperBound = q3 + 1.5 * iqr;
@@ -348,55 +455,92 @@ export function runQualityCheck(): QualityReport | null {
 
 export function getDescriptiveStats(): DescriptiveStats | null {
   if (!currentDataset) return null;
+  if (descriptiveStatsCache) return descriptiveStatsCache;
 
   const { data, columnTypes } = currentDataset;
   const continuous: DescriptiveStats['continuous'] = {};
   const categorical: DescriptiveStats['categorical'] = {};
 
+  // Pull every continuous column out in one walk over the rows
+  const continuousCols = Object.keys(columnTypes).filter(col => columnTypes[col] === 'continuous');
+  const continuousValues = numericColumns(data, continuousCols);
+
   Object.keys(columnTypes).forEach(col => {
     if (columnTypes[col] === 'continuous') {
-      const values = data.map(row => Number(row[col])).filter(v => !isNaN(v));
+      const values = continuousValues[col];
       
       if (values.length > 0) {
+        const { mean, std, skewness, min, max } = columnMoments(values);
         continuous[col] = {
           n: values.length,
-          mean: stats.mean(values),
-          std: stats.standardDeviation(values),
+          mean,
+          std,
           median: stats.median(values),
-          min: stats.min(values),
-          max: stats.max(values),
-          skewness: calculateSkewness(values)
+          min,
+          max,
+          skewness
         };
       }
     } else {
-      const values = data.map(row => row[col]).filter(v => v !== null && v !== undefined && v !== '');
-      const uniqueValues = Array.from(new Set(values));
-      const categories = uniqueValues.map(cat => ({
+      // Count and total in one pass; percentages come from the counts
+      const counts = new Map<any, number>();
+      let total = 0;
+      for (const row of data) {
+        const v = row[col];
+        if (isMissing(v)) continue;
+        counts.set(v, (counts.get(v) || 0) + 1);
+        total++;
+      }
+
+      const categories = Array.from(counts, ([cat, n]) => ({
         category: String(cat),
-        n: values.filter(v => v === cat).length,
-        percentage: (values.filter(v => v === cat).length / values.length) * 100
+        n,
+        percentage: (n / total) * 100
       }));
 
       categorical[col] = {
-        n: values.length,
-        unique_values: uniqueValues.length,
+        n: total,
+        unique_values: counts.size,
         categories: categories.sort((a, b) => b.n - a.n)
       };
     }
   });
 
-  return { continuous, categorical };
+  descriptiveStatsCache = { continuous, categorical };
+  return descriptiveStatsCache;
 }
 
-function calculateSkewness(values: number[]): number {
+/**
+ * Min, max, mean, (population) standard deviation and skewness in a single
+ * pass, accumulating the second and third central moments alongside the mean
+ */
+function columnMoments(values: number[]): {
+  mean: number; std: number; skewness: number; min: number; max: number
+} {
+  let mean = 0;
+  let m2 = 0;
+  let m3 = 0;
+  let min = Infinity;
+  let max = -Infinity;
+
+  for (let i = 0; i < values.length; i++) {
+    if (values[i] < min) min = values[i];
+    if (values[i] > max) max = values[i];
+
+    const n = i + 1;
+    const delta = values[i] - mean;
+    const deltaN = delta / n;
+    const term = delta * deltaN * i;
+    mean += deltaN;
+    m3 += term * deltaN * (n - 2) - 3 * deltaN * m2;
+    m2 += term;
+  }
+
   const n = values.length;
-  const mean = stats.mean(values);
-  const std = stats.standardDeviation(values);
-  
-  if (std === 0) return 0;
-  
-  const sum = values.reduce((acc, val) => acc + Math.pow((val - mean) / std, 3), 0);
-  return (n / ((n - 1) * (n - 2))) * sum;
+  const std = Math.sqrt(m2 / n);
+  const skewness = std === 0 ? 0 : (n / ((n - 1) * (n - 2))) * (m3 / Math.pow(std, 3));
+
+  return { mean, std, skewness, min, max };
 }
 
 // ============================================================================
@@ -407,7 +551,7 @@ async function callDeepSeekR1(prompt: string): Promise<{
   content: string;
   reasoning?: string;
 }> {
-  const response = await fetch(API_URL, {
+  const response = await fetchWithRetry(API_URL, {
     method: 'POST',
     headers: {
       'Content-Type': 'application/json',
@@ -449,6 +593,12 @@ Be precise with numbers and calculations.`
   };
 }
 
+// Analyses computed in the browser instead of by the AI
+const LOCAL_ANALYSES = new Map<string, typeof calculateCorrelation>([
+  ['correlation', calculateCorrelation],
+  ['linear_regression', calculateRegression]
+]);
+
 export async function runStatisticalAnalysis(
   analysisType: string,
   variables: string[],
@@ -459,10 +609,15 @@ export async function runStatisticalAnalysis(
   const { data, columnTypes } = currentDataset;
 
   // First, try basic statistical calculations for common analyses
-  if (analysisType === 'correlation' && variables.length >= 2) {
-    return calculateCorrelation(data, variables, columnTypes);
-  } else if (analysisType === 'linear_regression' && variables.length >= 2) {
-    return calculateRegression(data, variables, columnTypes);
+  const localAnalysis = LOCAL_ANALYSES.get(analysisType);
+  if (localAnalysis && variables.length >= 2) {
+    const cacheKey = [analysisType, ...variables].join('\u0000');
+    let result = localResultCache.get(cacheKey);
+    if (!result) {
+      result = localAnalysis(data, variables, columnTypes);
+      localResultCache.set(cacheKey, result);
+    }
+    return result;
   }
 
   // For complex analyses, use AI
@@ -504,6 +659,52 @@ Format your response clearly with these sections.`;
   }
 }
 
+/**
+ * Means plus centered sums of squares and cross-products of two paired
+ * columns. One streaming pass updates everything together, so the data
+ * isn't read again for the means
+ */
+function coMoments(x: number[], y: number[]): {
+  meanX: number; meanY: number; sumXY: number; sumX2: number; sumY2: number
+} {
+  let meanX = 0, meanY = 0;
+  let sumXY = 0, sumX2 = 0, sumY2 = 0;
+  for (let i = 0; i < x.length; i++) {
+    const dx = x[i] - meanX;
+    const dy = y[i] - meanY;
+    meanX += dx / (i + 1);
+    meanY += dy / (i + 1);
+    const dy2 = y[i] - meanY;
+    sumXY += dx * dy2;
+    sumX2 += dx * (x[i] - meanX);
+    sumY2 += dy * dy2;
+  }
+  return { meanX, meanY, sumXY, sumX2, sumY2 };
+}
+
+// Exclusive lower bounds on |r| for each strength label, strongest first;
+// anything below the last rung is 'weak'
+const CORRELATION_STRENGTH = [
+  { min: 0.7, label: 'strong' },
+  { min: 0.4, label: 'moderate' }
+];
+const REGRESSION_STRENGTH = [
+  { min: 0.5, label: 'strong' },
+  { min: 0.3, label: 'moderate' }
+];
+
+function strengthOf(r: number, ladder: Array<{ min: number; label: string }>): string {
+  const size = Math.abs(r);
+  for (const rung of ladder) {
+    if (size > rung.min) return rung.label;
+  }
+  return 'weak';
+}
+
+function formatR(r: number): string {
+  return Number.isNaN(r) ? '—' : r.toFixed(3);
+}
+
 // Calculate correlation matrix
 function calculateCorrelation(
   data: Record<string, any>[],
@@ -524,60 +725,80 @@ function calculateCorrelation(
 
   // Calculate correlation matrix
   const correlations: Record<string, Record<string, number>> = {};
-  const n = data.length;
+
+  // Pairs can have different numbers of complete rows, so track the range
+  // for the report and the first pair's n for its degrees of freedom
+  let minN = Infinity;
+  let maxN = 0;
+  let firstPairN = 0;
+
+  // Fill the upper triangle and mirror it; the matrix is symmetric with a
+  // unit diagonal. Each pair uses the rows where both variables are present
+  continuousVars.forEach(v => {
+    correlations[v] = { [v]: 1 };
+  });
+
+  // Each pair's interpretation line is written as soon as its r is known,
+  // so the matrix isn't walked a second time
+  const pairLines: string[] = [];
 
   for (let i = 0; i < continuousVars.length; i++) {
-    correlations[continuousVars[i]] = {};
-    for (let j = 0; j < continuousVars.length; j++) {
+    for (let j = i + 1; j < continuousVars.length; j++) {
       const var1 = continuousVars[i];
       const var2 = continuousVars[j];
-      
-      const values1 = data.map(row => Number(row[var1])).filter(v => !isNaN(v));
-      const values2 = data.map(row => Number(row[var2])).filter(v => !isNaN(v));
-      
-      correlations[var1][var2] = stats.sampleCorrelation(values1, values2);
+      // Pearson r from one co-moment pass; the n - 1 factors of the sample
+      // covariance and SDs cancel
+      const [x, y] = pairedColumns(data, var1, var2);
+      const pairN = x.length;
+      const { sumXY, sumX2, sumY2 } = coMoments(x, y);
+
+      if (i === 0 && j === 1) firstPairN = pairN;
+      minN = Math.min(minN, pairN);
+      maxN = Math.max(maxN, pairN);
+
+      // r is undefined with too few rows or a column that never varies; say
+      // so instead of labelling NaN as a weak correlation
+      if (pairN < 3 || sumX2 * sumY2 === 0) {
+        correlations[var1][var2] = NaN;
+        correlations[var2][var1] = NaN;
+        const reason = pairN < 3
+          ? `fewer than 3 rows have both values`
+          : `${sumX2 === 0 ? var1 : var2} has the same value in every row`;
+        pairLines.push(`• ${var1} and ${var2}: correlation not computed (${reason}, n = ${pairN})\n`);
+        continue;
+      }
+
+      const r = sumXY / Math.sqrt(sumX2 * sumY2);
+      correlations[var1][var2] = r;
+      correlations[var2][var1] = r;
+
+      const strength = strengthOf(r, CORRELATION_STRENGTH);
+      const direction = r > 0 ? 'positive' : 'negative';
+      pairLines.push(`• ${var1} and ${var2}: ${strength} ${direction} correlation (r = ${r.toFixed(3)}, n = ${pairN})\n`);
     }
   }
 
   // Format output
   let output = 'CORRELATION ANALYSIS RESULTS\n';
   output += '============================\n\n';
-  output += `Sample Size: ${n}\n\n`;
+  output += minN === maxN
+    ? `Sample Size: ${minN}\n\n`
+    : `Sample Size: ${minN}-${maxN} complete rows per pair (missing values excluded pairwise)\n\n`;
   output += 'Correlation Matrix (Pearson r):\n\n';
   
-  // Header
-  output += '          ';
-  continuousVars.forEach(v => {
-    output += `${v.substring(0, 8).padEnd(10)}`;
-  });
-  output += '\n';
-  
-  // Matrix
-  continuousVars.forEach(var1 => {
-    output += `${var1.substring(0, 8).padEnd(10)}`;
-    continuousVars.forEach(var2 => {
-      const r = correlations[var1][var2];
-      output += `${r.toFixed(3).padStart(10)}`;
-    });
-    output += '\n';
-  });
+  // Header and matrix rows, each built with a single join
+  const labels = continuousVars.map(v => v.substring(0, 8).padEnd(10));
+  const matrixRows = continuousVars.map((var1, i) =>
+    labels[i] + continuousVars.map(var2 => formatR(correlations[var1][var2]).padStart(10)).join('')
+  );
+  output += ['          ' + labels.join(''), ...matrixRows].join('\n') + '\n';
 
   // Interpretation
-  let interpretation = '\n\nINTERPRETATION:\n\n';
-  for (let i = 0; i < continuousVars.length; i++) {
-    for (let j = i + 1; j < continuousVars.length; j++) {
-      const var1 = continuousVars[i];
-      const var2 = continuousVars[j];
-      const r = correlations[var1][var2];
-      const strength = Math.abs(r) > 0.7 ? 'strong' : Math.abs(r) > 0.4 ? 'moderate' : 'weak';
-      const direction = r > 0 ? 'positive' : 'negative';
-      
-      interpretation += `• ${var1} and ${var2}: ${strength} ${direction} correlation (r = ${r.toFixed(3)})\n`;
-    }
-  }
+  const interpretation = '\n\nINTERPRETATION:\n\n' + pairLines.join('');
 
   // APA format
-  const firstPair = `r(${n - 2}) = ${correlations[continuousVars[0]][continuousVars[1]].toFixed(2)}, p < .05`;
+  const firstR = correlations[continuousVars[0]][continuousVars[1]];
+  const firstPair = Number.isNaN(firstR) ? 'N/A' : `r(${firstPairN - 2}) = ${firstR.toFixed(2)}, p < .05`;
 
   return {
     test_type: 'correlation',
@@ -611,57 +832,72 @@ function calculateRegression(
   const dv = continuousVars[0];
   const ivs = continuousVars.slice(1);
   
-  const y = data.map(row => Number(row[dv])).filter(v => !isNaN(v));
-  const n = y.length;
-  
-  // Simple linear regression with first IV
+  // Simple linear regression with first IV, on rows where both are present
   const iv = ivs[0];
-  const x = data.map(row => Number(row[iv])).filter(v => !isNaN(v));
-  
-  // Calculate regression statistics
-  const meanX = stats.mean(x);
-  const meanY = stats.mean(y);
+  const [x, y] = pairedColumns(data, iv, dv);
+  const n = y.length;
   
-  let sumXY = 0, sumX2 = 0;
-  for (let i = 0; i < Math.min(x.length, y.length); i++) {
-    sumXY += (x[i] - meanX) * (y[i] - meanY);
-    sumX2 += Math.pow(x[i] - meanX, 2);
+  const { meanX, meanY, sumXY, sumX2, sumY2 } = coMoments(x, y);
+
+  // A line can't be fitted through fewer than three paired rows or a
+  // predictor that never varies, and R is undefined for a constant outcome;
+  // say so instead of reporting NaN/Infinity
+  if (n < 3 || sumX2 === 0 || sumY2 === 0) {
+    return {
+      test_type: 'regression',
+      summary: 'Insufficient variation',
+      statistical_output: n < 3
+        ? `Need at least 3 rows with both ${dv} and ${iv} present for regression.`
+        : sumX2 === 0
+          ? `${iv} has the same value in every row, so it cannot predict ${dv}.`
+          : `${dv} has the same value in every row, so there is no variance to explain.`,
+      interpretation: 'Please check the selected variables for missing or constant values.',
+      apa_format: 'N/A'
+    };
   }
   
   const slope = sumXY / sumX2;
   const intercept = meanY - slope * meanX;
-  const r = stats.sampleCorrelation(x, y);
+  const r = sumXY / Math.sqrt(sumX2 * sumY2);
   const r2 = r * r;
   
-  // Calculate residual standard error
-  let sse = 0;
-  for (let i = 0; i < Math.min(x.length, y.length); i++) {
-    const predicted = intercept + slope * x[i];
-    sse += Math.pow(y[i] - predicted, 2);
-  }
+  // Residual sum of squares from the same sums (SSE = Syy - b*Sxy), instead
+  // of a second pass over the fitted values
+  const sse = Math.max(0, sumY2 - slope * sumXY);
   const mse = sse / (n - 2);
   const rmse = Math.sqrt(mse);
   
-  let output = 'LINEAR REGRESSION ANALYSIS\n';
-  output += '==========================\n\n';
-  output += `Dependent Variable: ${dv}\n`;
-  output += `Independent Variable: ${iv}\n`;
-  output += `Sample Size: ${n}\n\n`;
-  output += 'Model Summary:\n';
-  output += `R = ${r.toFixed(3)}\n`;
-  output += `R² = ${r2.toFixed(3)}\n`;
-  output += `Adjusted R² = ${(1 - (1 - r2) * (n - 1) / (n - 2)).toFixed(3)}\n`;
-  output += `RMSE = ${rmse.toFixed(3)}\n\n`;
-  output += 'Coefficients:\n';
-  output += `Intercept = ${intercept.toFixed(3)}\n`;
-  output += `${iv} = ${slope.toFixed(3)}\n\n`;
-  output += `Regression Equation:\n`;
-  output += `${dv} = ${intercept.toFixed(3)} + ${slope.toFixed(3)} * ${iv}\n`;
+  // Values that appear more than once in the report are formatted once
+  const r2Text = r2.toFixed(3);
+  const interceptText = intercept.toFixed(3);
+  const slopeText = slope.toFixed(3);
+
+  const output = [
+    'LINEAR REGRESSION ANALYSIS',
+    '==========================',
+    '',
+    `Dependent Variable: ${dv}`,
+    `Independent Variable: ${iv}`,
+    `Sample Size: ${n}`,
+    '',
+    'Model Summary:',
+    `R = ${r.toFixed(3)}`,
+    `R² = ${r2Text}`,
+    `Adjusted R² = ${(1 - (1 - r2) * (n - 1) / (n - 2)).toFixed(3)}`,
+    `RMSE = ${rmse.toFixed(3)}`,
+    '',
+    'Coefficients:',
+    `Intercept = ${interceptText}`,
+    `${iv} = ${slopeText}`,
+    '',
+    'Regression Equation:',
+    `${dv} = ${interceptText} + ${slopeText} * ${iv}`
+  ].join('\n') + '\n';
 
   const interpretation = `\nINTERPRETATION:\n\n` +
-    `The regression model explains ${(r2 * 100).toFixed(1)}% of the variance in ${dv} (R² = ${r2.toFixed(3)}). ` +
+    `The regression model explains ${(r2 * 100).toFixed(1)}% of the variance in ${dv} (R² = ${r2Text}). ` +
     `For every one-unit increase in ${iv}, ${dv} ${slope > 0 ? 'increases' : 'decreases'} by ${Math.abs(slope).toFixed(3)} units on average. ` +
-    `The model shows a ${Math.abs(r) > 0.5 ? 'strong' : Math.abs(r) > 0.3 ? 'moderate' : 'weak'} relationship between the variables.`;
+    `The model shows a ${strengthOf(r, REGRESSION_STRENGTH)} relationship between the variables.`;
 
   const apa = `The regression model was statistically significant, R² = ${r2.toFixed(2)}, F(1, ${n-2}) = [F-value], p < .05. ${iv} was a significant predictor of ${dv}, β = ${slope.toFixed(2)}, t(${n-2}) = [t-value], p < .05.`;
 
@@ -684,7 +920,7 @@ function prepareDataSummary(
 
   variables.forEach(varName => {
     const type = columnTypes[varName];
-    const values = data.map(row => row[varName]).filter(v => v !== null && v !== undefined && v !== '');
+    const values = data.map(row => row[varName]).filter(v => !isMissing(v));
 
     if (type === 'continuous') {
       const numValues = values.map(Number);
@@ -739,6 +975,8 @@ export function getCurrentDataset(): DatasetInfo | null {
 }
 
 export function clearCurrentDataset(): void {
+  localResultCache.clear();
+  descriptiveStatsCache = null;
   currentDataset = null;
 }
 
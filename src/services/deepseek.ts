@@ -1,6 +1,8 @@
 // DeepSeek R1 Reasoner API Service
 // For the "Ask AI" module - helping students understand any concept
 
+import { fetchWithRetry } from '../utils/fetchWithRetry';
+
 const API_KEY = import.meta.env.VITE_DEEPSEEK_API_KEY;
 const API_URL = 'https://api.deepseek.com/v1/chat/completions';
 
@@ -55,7 +57,9 @@ async function callDeepSeekAPI(
   model: string,
   maxTokens: number = 4000
 ): Promise<ChatResponse> {
-  const response = await fetch(API_URL, {
+  // All models share one endpoint; fall back to the next model rather than
+  // retrying the same one
+  const response = await fetchWithRetry(API_URL, {
     method: 'POST',
     headers: {
       'Content-Type': 'application/json',
@@ -68,7 +72,7 @@ async function callDeepSeekAPI(
       temperature: 0.7,
       stream: false,
     }),
-  });
+  }, { retries: 0 });
 
   if (!response.ok) {
     const errorText = await response.text();
@@ -103,9 +107,9 @@ export async function askDeepSeek(
   
   for (const model of MODELS) {
     try {
-      console.log(`Trying DeepSeek model: ${model}`);
+      if (import.meta.env.DEV) console.log(`Trying DeepSeek model: ${model}`);
       const response = await callDeepSeekAPI(messages, model);
-      console.log(`Successfully used model: ${model}`);
+      if (import.meta.env.DEV) console.log(`Successfully used model: ${model}`);
       return response;
     } catch (error) {
       console.warn(`Model ${model} failed:`, error);
@@ -2,6 +2,7 @@
 // Uses chapter-by-chapter generation to produce genuinely long proposals
 
 import type { ResearchFormData } from '../types/research';
+import { fetchWithRetry } from '../utils/fetchWithRetry';
 
 // API Key is loaded from environment variable (.env.local)
 const API_KEY = import.meta.env.VITE_GEMINI_API_KEY;
@@ -48,7 +49,7 @@ export async function listAvailableModels(): Promise<string[]> {
   }
 
   try {
-    const response = await fetch(
+    const response = await fetchWithRetry(
       `https://generativelanguage.googleapis.com/v1beta/models?key=${API_KEY}`
     );
     
@@ -59,7 +60,7 @@ export async function listAvailableModels(): Promise<string[]> {
     
     const data = await response.json();
     const models = data.models?.map((m: any) => m.name) || [];
-    console.log('Available Gemini models:', models);
+    if (import.meta.env.DEV) console.log('Available Gemini models:', models);
     return models;
   } catch (error) {
     console.error('Error listing models:', error);
@@ -73,22 +74,18 @@ async function generateContentWithFallback(prompt: string, maxTokens: number = 1
     throw new Error('Gemini API key not configured. Please add VITE_GEMINI_API_KEY to your .env.local file.');
   }
 
-  // First, try to list available models (for debugging)
-  const availableModels = await listAvailableModels();
-  if (availableModels.length > 0) {
-    console.log('🔍 Found', availableModels.length, 'available models');
-  }
-
   let lastError: Error | null = null;
   const triedModels: string[] = [];
 
   for (const model of PROPOSAL_MODELS) {
     triedModels.push(model);
     try {
-      console.log(`🔄 Trying model: ${model}...`);
+      if (import.meta.env.DEV) console.log(`🔄 Trying model: ${model}...`);
       const url = `https://generativelanguage.googleapis.com/v1beta/models/${model}:generateContent?key=${API_KEY}`;
       
-      const response = await fetch(url, {
+      // Long sections can take minutes to generate, so there is no timeout;
+      // no retries either, since the loop already falls back to the next model
+      const response = await fetchWithRetry(url, {
         method: 'POST',
         headers: {
           'Content-Type': 'application/json',
@@ -102,7 +99,7 @@ async function generateContentWithFallback(prompt: string, maxTokens: number = 1
             maxOutputTokens: maxTokens,
           },
         }),
-      });
+      }, { retries: 0 });
 
       if (!response.ok) {
         const errorText = await response.text();
@@ -113,7 +110,7 @@ async function generateContentWithFallback(prompt: string, maxTokens: number = 1
       const data: GeminiResponse = await response.json();
       const generatedText = data.candidates[0]?.content?.parts[0]?.text || '';
       
-      console.log(`✅ Successfully used Gemini model: ${model}`);
+      if (import.meta.env.DEV) console.log(`✅ Successfully used Gemini model: ${model}`);
       return generatedText;
 
     } catch (error) {
@@ -122,7 +119,9 @@ async function generateContentWithFallback(prompt: string, maxTokens: number = 1
     }
   }
 
-  // Provide helpful error message
+  // Provide helpful error message; the account's models are only listed
+  // (for debugging) once every model has failed
+  const availableModels = await listAvailableModels();
   const errorMsg = `All Gemini models failed. Tried: ${triedModels.join(', ')}.
 
 Last error: ${lastError?.message}
@@ -687,6 +686,14 @@ For HISTORY: Tell it as a story with characters and motivations
 
 Remember: Your job is to make the student feel smart for understanding, not to show off how much you know.`;
 
+// Use Flash models for speed - January 2026 model names
+const ASK_AI_MODELS = [
+  'gemini-3-flash-preview',    // Latest fast model - Late 2025
+  'gemini-3-pro-preview',      // Latest SOTA - Nov 2025
+  'gemini-2.5-flash',          // Mature fast model
+  'gemini-2.5-pro',            // Mature pro model
+];
+
 export interface AskAIMessage {
   role: 'user' | 'assistant';
   content: string;
@@ -717,21 +724,14 @@ ${userMessage}
 
 YOUR RESPONSE:`;
 
-  // Use Flash models for speed - January 2026 model names
-  const flashModels = [
-    'gemini-3-flash-preview',    // Latest fast model - Late 2025
-    'gemini-3-pro-preview',      // Latest SOTA - Nov 2025
-    'gemini-2.5-flash',          // Mature fast model
-    'gemini-2.5-pro',            // Mature pro model
-  ];
-
   let lastError: Error | null = null;
 
-  for (const model of flashModels) {
+  for (const model of ASK_AI_MODELS) {
     try {
       const url = `https://generativelanguage.googleapis.com/v1beta/models/${model}:generateContent?key=${API_KEY}`;
       
-      const response = await fetch(url, {
+      // The loop falls back to the next model, so fail over instead of retrying
+      const response = await fetchWithRetry(url, {
         method: 'POST',
         headers: {
           'Content-Type': 'application/json',
@@ -744,7 +744,7 @@ YOUR RESPONSE:`;
             topP: 0.9,
           },
         }),
-      });
+      }, { retries: 0 });
 
       if (!response.ok) {
         const errorText = await response.text();
@@ -806,57 +806,66 @@ Respond helpfully:`;
 }
 
 // Research Builder Chat - Simple conversational helper for research sections
-export async function researchChat(
-  prompt: string,
-  context: 'proposal' | 'literature' | 'methodology' | 'discussion' | 'research' | 'coursework' = 'research'
-): Promise<string> {
-  if (!API_KEY) {
-    throw new Error('Gemini API key not configured. Please add VITE_GEMINI_API_KEY to your .env.local file.');
-  }
-
-  const contextInstructions: Record<string, string> = {
-    proposal: `You are helping a student build their research proposal. Guide them conversationally through:
+// Context prompts and model list are built once at module load
+const RESEARCH_CHAT_CONTEXTS: Record<string, string> = {
+  proposal: `You are helping a student build their research proposal. Guide them conversationally through:
 - Defining their research topic
 - Writing background/introduction
 - Creating problem statements
 - Developing objectives and research questions
 - Explaining significance of the study
 Keep responses concise (under 200 words) and encouraging.`,
-    
-    literature: `You are helping a student with their literature review. Help them:
+  
+  literature: `You are helping a student with their literature review. Help them:
 - Find and organize sources by themes
 - Summarize academic sources
 - Identify research gaps
 - Write literature synthesis
 Keep responses focused and practical.`,
-    
-    methodology: `You are helping a student design their research methodology. Guide them through:
+  
+  methodology: `You are helping a student design their research methodology. Guide them through:
 - Choosing research design (quantitative/qualitative/mixed)
 - Sampling methods and sample size
 - Data collection instruments
 - Data analysis approaches
 - Ethical considerations
 Explain concepts simply and practically.`,
-    
-    discussion: `You are helping a student write their discussion and conclusion. Help them:
+  
+  discussion: `You are helping a student write their discussion and conclusion. Help them:
 - Interpret findings
 - Connect to existing literature
 - Identify implications
 - Acknowledge limitations
 - Write recommendations
 Be supportive and specific.`,
-    
-    research: `You are an expert research advisor helping a Ugandan university student with their thesis/dissertation. Be conversational, encouraging, and practical. Keep responses under 200 words unless generating content.`,
+  
+  research: `You are an expert research advisor helping a Ugandan university student with their thesis/dissertation. Be conversational, encouraging, and practical. Keep responses under 200 words unless generating content.`,
 
-    coursework: `You are an expert academic writing assistant producing distinction-level (70%+) coursework for university students. You write with the precision of a professor, clarity of an editor, and insight of a subject expert.
+  coursework: `You are an expert academic writing assistant producing distinction-level (70%+) coursework for university students. You write with the precision of a professor, clarity of an editor, and insight of a subject expert.
 - Use critical analysis, not description
 - Avoid AI clichés and banned phrases
 - Use proper academic citations
 - Maintain formal academic tone
 - Every claim must be evidence-backed`
-  };
+};
+
+// Use Flash models for quick responses - January 2026 model names
+const RESEARCH_CHAT_MODELS = [
+  'gemini-2.5-flash',
+  'gemini-2.5-pro',
+  'gemini-2.0-flash-exp',
+  'gemini-1.5-flash',
+];
 
-  const systemPrompt = contextInstructions[context] || contextInstructions.research;
+export async function researchChat(
+  prompt: string,
+  context: 'proposal' | 'literature' | 'methodology' | 'discussion' | 'research' | 'coursework' = 'research'
+): Promise<string> {
+  if (!API_KEY) {
+    throw new Error('Gemini API key not configured. Please add VITE_GEMINI_API_KEY to your .env.local file.');
+  }
+
+  const systemPrompt = RESEARCH_CHAT_CONTEXTS[context] || RESEARCH_CHAT_CONTEXTS.research;
 
   const fullPrompt = `${systemPrompt}
 
@@ -865,21 +874,14 @@ ${prompt}
 
 YOUR RESPONSE:`;
 
-  // Use Flash models for quick responses - January 2026 model names
-  const models = [
-    'gemini-2.5-flash',
-    'gemini-2.5-pro',
-    'gemini-2.0-flash-exp',
-    'gemini-1.5-flash',
-  ];
-
   let lastError: Error | null = null;
 
-  for (const model of models) {
+  for (const model of RESEARCH_CHAT_MODELS) {
     try {
       const url = `https://generativelanguage.googleapis.com/v1beta/models/${model}:generateContent?key=${API_KEY}`;
       
-      const response = await fetch(url, {
+      // The loop falls back to the next model, so fail over instead of retrying
+      const response = await fetchWithRetry(url, {
         method: 'POST',
         headers: {
           'Content-Type': 'application/json',
@@ -892,10 +894,9 @@ YOUR RESPONSE:`;
             topP: 0.9,
           },
         }),
-      });
+      }, { retries: 0 });
 
       if (!response.ok) {
-        const errorText = await response.text();
         console.warn(`Model ${model} failed:`, response.status);
         throw new Error(`Model ${model} failed: ${response.status}`);
       }
@@ -907,7 +908,7 @@ YOUR RESPONSE:`;
         throw new Error('No content in response');
       }
 
-      console.log(`✅ researchChat used model: ${model}`);
+      if (import.meta.env.DEV) console.log(`✅ researchChat used model: ${model}`);
       return text;
     } catch (error) {
       console.warn(`researchChat model ${model} failed:`, error);
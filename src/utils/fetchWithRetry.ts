@@ -0,0 +1,105 @@
+// Resilient fetch for AI API calls
+// Retries transient failures with backoff and keeps a per-endpoint circuit
+// breaker so a dead endpoint fails fast instead of stalling. Callers that
+// loop over fallback models pass { retries: 0 } and rely on the breaker
+// alone. Retries only run for single-endpoint calls: the Qualitative Lab
+// DeepSeek request, the Gemini model listing and Data Lab's callDeepSeekR1
+// (not reached by any analysis Data Lab currently offers)
+
+const RETRY_STATUSES = new Set([429, 500, 502, 503, 504]);
+
+const BREAKER_THRESHOLD = 3;          // consecutive failures before opening
+const BREAKER_COOLDOWN_MS = 30_000;   // how long an open breaker short-circuits
+const MAX_RETRY_DELAY_MS = 30_000;    // cap on a server-requested Retry-After
+
+export interface RetryOptions {
+  retries?: number;
+  backoffMs?: number;
+}
+
+interface BreakerState {
+  failures: number;
+  openUntil: number;
+}
+
+const breakers = new Map<string, BreakerState>();
+
+export class CircuitOpenError extends Error {
+  constructor(endpoint: string) {
+    super(`${endpoint} is temporarily unavailable after repeated failures`);
+    this.name = 'CircuitOpenError';
+  }
+}
+
+function getBreaker(url: string): { endpoint: string; breaker: BreakerState } {
+  // Key by origin + path so the API key query string is never part of the key
+  const { origin, pathname } = new URL(url);
+  const endpoint = origin + pathname;
+
+  let breaker = breakers.get(endpoint);
+  if (!breaker) {
+    breaker = { failures: 0, openUntil: 0 };
+    breakers.set(endpoint, breaker);
+  }
+  return { endpoint, breaker };
+}
+
+function recordOutcome(breaker: BreakerState, success: boolean): void {
+  if (success) {
+    breaker.failures = 0;
+    breaker.openUntil = 0;
+    return;
+  }
+
+  breaker.failures++;
+  if (breaker.failures >= BREAKER_THRESHOLD) {
+    breaker.openUntil = Date.now() + BREAKER_COOLDOWN_MS;
+  }
+}
+
+function retryDelay(response: Response | null, attempt: number, backoffMs: number): number {
+  const retryAfter = Number(response?.headers.get('Retry-After'));
+  if (retryAfter > 0) {
+    return Math.min(retryAfter * 1000, MAX_RETRY_DELAY_MS);
+  }
+  return backoffMs * 2 ** attempt;
+}
+
+function delay(ms: number): Promise<void> {
+  return new Promise(resolve => setTimeout(resolve, ms));
+}
+
+export async function fetchWithRetry(
+  url: string,
+  init: RequestInit = {},
+  options: RetryOptions = {}
+): Promise<Response> {
+  const { retries = 2, backoffMs = 500 } = options;
+  const { endpoint, breaker } = getBreaker(url);
+
+  if (breaker.openUntil > Date.now()) {
+    throw new CircuitOpenError(endpoint);
+  }
+
+  for (let attempt = 0; ; attempt++) {
+    try {
+      const response = await fetch(url, init);
+
+      if (RETRY_STATUSES.has(response.status) && attempt < retries) {
+        // Release the discarded response's connection before waiting
+        await response.body?.cancel().catch(() => undefined);
+        await delay(retryDelay(response, attempt, backoffMs));
+        continue;
+      }
+
+      recordOutcome(breaker, !RETRY_STATUSES.has(response.status));
+      return response;
+    } catch (error) {
+      if (attempt >= retries) {
+        recordOutcome(breaker, false);
+        throw error;
+      }
+      await delay(retryDelay(null, attempt, backoffMs));
+    }
+  }
+}